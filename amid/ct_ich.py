@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 
 from .internals import Dataset, field, licenses, register
+from .utils import nii_data
 
 
 @register(
@@ -57,7 +58,7 @@ class CT_ICH(Dataset):
     @field
     def image(self, i) -> np.ndarray:
         # most CT/MRI scans are integer-valued, this will help us improve compression rates
-        return np.int16(self._image_file(i).get_fdata())
+        return nii_data(self._image_file(i), np.int16)
 
     @field
     def mask(self, i) -> np.ndarray:
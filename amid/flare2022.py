@@ -1,13 +1,12 @@
-import gzip
 import zipfile
-from pathlib import Path
+from functools import cached_property
 from typing import Union
 from zipfile import ZipFile
 
-import nibabel
 import numpy as np
 
 from .internals import Dataset, field, register
+from .utils import nii_gz_from_bytes, open_nii_gz_file
 
 
 @register(
@@ -56,23 +55,7 @@ class FLARE2022(Dataset):
 
     @property
     def ids(self):
-        result = set()
-
-        # 50 Training Labeled cases
-        archive = self.root / 'Training' / 'FLARE22_LabeledCase50' / 'images.zip'
-        with ZipFile(archive) as zf:
-            for file in zf.namelist():
-                result.add(f"TL{file.split('_')[-2]}")
-
-        # 2000 Training Unlabeled cases
-        for archive in (self.root / 'Training').glob('*.zip'):
-            with ZipFile(archive) as zf:
-                for file in zf.namelist():
-                    if not file.endswith('.nii.gz'):
-                        continue
-
-                    file = Path(file)
-                    result.add(f"TU{file.name.split('_')[-2]}")
+        result = set(self._archived)
 
         # 50 Validation Unlabeled cases
         for file in (self.root / 'Validation').glob('*'):
@@ -83,21 +66,50 @@ class FLARE2022(Dataset):
 
         return sorted(result)
 
-    def _file(self, i):
+    @cached_property
+    def _archived(self):
+        # id -> (archive, member) for all the cases stored in zip archives
+        result = {}
+
         # 50 Training Labeled cases
-        if i.startswith('TL'):
-            archive = self.root / 'Training' / 'FLARE22_LabeledCase50' / 'images.zip'
-            with ZipFile(archive) as zf:
-                for file in zf.namelist():
-                    if i[2:] in file:
-                        return zipfile.Path(archive, file)
+        archive = self.root / 'Training' / 'FLARE22_LabeledCase50' / 'images.zip'
+        with ZipFile(archive) as zf:
+            for zipinfo in zf.infolist():
+                if zipinfo.is_dir():
+                    continue
+                result.setdefault(f"TL{zipinfo.filename.split('_')[-2]}", (archive, zipinfo.filename))
 
         # 2000 Training Unlabeled cases
         for archive in (self.root / 'Training').glob('*.zip'):
             with ZipFile(archive) as zf:
-                for file in zf.namelist():
-                    if i[2:] in file:
-                        return zipfile.Path(archive, file)
+                for zipinfo in zf.infolist():
+                    if zipinfo.is_dir() or not zipinfo.filename.endswith('.nii.gz'):
+                        continue
+
+                    name = zipinfo.filename.rsplit('/', 1)[-1]
+                    result.setdefault(f"TU{name.split('_')[-2]}", (archive, zipinfo.filename))
+
+        return result
+
+    @cached_property
+    def _labels(self):
+        # id -> member of labels.zip
+        archive = self.root / 'Training' / 'FLARE22_LabeledCase50' / 'labels.zip'
+        result = {}
+        with ZipFile(archive) as zf:
+            for zipinfo in zf.infolist():
+                if zipinfo.is_dir() or not zipinfo.filename.endswith('.nii.gz'):
+                    continue
+
+                # labels are named after their images without the `_0000` channel suffix
+                result[f"TL{zipinfo.filename[: -len('.nii.gz')].split('_')[-1]}"] = zipinfo.filename
+
+        return result
+
+    def _file(self, i):
+        # 2050 Training Labeled and Unlabeled cases
+        if i in self._archived:
+            return zipfile.Path(*self._archived[i])
 
         # 50 Validation Unlabeled cases
         if i.startswith('VU'):
@@ -109,31 +121,22 @@ class FLARE2022(Dataset):
     @field
     def image(self, i) -> np.ndarray:
         with self._file(i).open('rb') as opened:
-            with gzip.GzipFile(fileobj=opened) as nii:
-                nii = nibabel.FileHolder(fileobj=nii)
-                image = nibabel.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return np.asarray(image.dataobj)
+            image = nii_gz_from_bytes(opened.read())
+            return np.asarray(image.dataobj)
 
     @field
     def affine(self, i) -> np.ndarray:
         """The 4x4 matrix that gives the image's spatial orientation"""
-        with self._file(i).open('rb') as opened:
-            with gzip.GzipFile(fileobj=opened) as nii:
-                nii = nibabel.FileHolder(fileobj=nii)
-                image = nibabel.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return image.affine
+        # only the header is decompressed here
+        with self._file(i).open('rb') as opened, open_nii_gz_file(opened) as image:
+            return image.affine
 
     @field
     def mask(self, i) -> Union[np.ndarray, None]:
-        if not i.startswith('TL'):
+        if i not in self._labels:
             return None
 
         archive = self.root / 'Training' / 'FLARE22_LabeledCase50' / 'labels.zip'
-        with ZipFile(archive) as zf:
-            for file in zf.namelist():
-                if i[2:] in file:
-                    with zipfile.Path(archive, file).open('rb') as opened:
-                        with gzip.GzipFile(fileobj=opened) as nii:
-                            nii = nibabel.FileHolder(fileobj=nii)
-                            mask = nibabel.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                            return np.asarray(mask.dataobj)
+        with zipfile.Path(archive, self._labels[i]).open('rb') as opened:
+            mask = nii_gz_from_bytes(opened.read())
+            return np.asarray(mask.dataobj)
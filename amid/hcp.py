@@ -1,12 +1,12 @@
-import gzip
 import zipfile
+from functools import cached_property
 from pathlib import Path
 from zipfile import ZipFile
 
-import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, field, licenses, register
+from .utils import nii_gz_from_bytes, open_nii_gz_file
 
 
 @register(
@@ -31,35 +31,40 @@ class HCP(Dataset):
 
         return tuple(sorted(result))
 
-    def _file(self, i):
+    @cached_property
+    def _index(self):
+        # (subject, modality) -> (archive, filename) of the first matching file
+        index = {}
         for archive in self.root.glob('*.zip'):
             with ZipFile(archive) as zf:
                 for zipinfo in zf.infolist():
                     if zipinfo.is_dir():
                         continue
-                    file = Path(zipinfo.filename)
-                    if (i in file.stem) and ('T1w_MPR1' in file.stem):
-                        return zipfile.Path(str(archive), str(file))
+                    subject = zipinfo.filename.split('/')[0]
+                    stem = Path(zipinfo.filename).stem
+                    if (subject in stem) and ('T1w_MPR1' in stem):
+                        index.setdefault((subject, 'T1w_MPR1'), (archive, zipinfo.filename))
+
+        return index
+
+    def _file(self, i):
+        key = i, 'T1w_MPR1'
+        if key in self._index:
+            archive, file = self._index[key]
+            return zipfile.Path(str(archive), file)
 
     @field
     def image(self, i) -> np.ndarray:
         with self._file(i).open('rb') as opened:
-            with gzip.GzipFile(fileobj=opened) as nii:
-                nii = nb.FileHolder(fileobj=nii)
-                image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return np.int16(image.get_fdata())
+            image = nii_gz_from_bytes(opened.read())
+            return np.int16(image.get_fdata())
 
     @field
     def affine(self, i) -> np.ndarray:
-        with self._file(i).open('rb') as opened:
-            with gzip.GzipFile(fileobj=opened) as nii:
-                nii = nb.FileHolder(fileobj=nii)
-                image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return image.affine
+        # only the header is decompressed here
+        with self._file(i).open('rb') as opened, open_nii_gz_file(opened) as image:
+            return image.affine
 
     def spacing(self, i):
-        with self._file(i).open('rb') as opened:
-            with gzip.GzipFile(fileobj=opened) as nii:
-                nii = nb.FileHolder(fileobj=nii)
-                image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return tuple(image.header['pixdim'][1:4])
+        with self._file(i).open('rb') as opened, open_nii_gz_file(opened) as image:
+            return tuple(image.header['pixdim'][1:4])
@@ -11,11 +11,7 @@ class Dataset(ExternalBase):
     _fields: Sequence[str] = None
 
     def __init__(self, root: PathOrStr):
-        fields = None
-        if hasattr(self, '_fields'):
-            fields = self._fields
-
-        super().__init__(fields=fields, inputs=['id'], properties=['ids'], inherit=['id'])
+        super().__init__(fields=self._fields, inputs=['id'], properties=['ids'], inherit=['id'])
         self.root = Path(root)
 
     @classmethod
@@ -1,15 +1,18 @@
+import functools
 import importlib
-import inspect
+import sys
+import warnings
 from collections import OrderedDict
 from pathlib import Path
 from typing import NamedTuple, Type
 
-import pandas as pd
-
 from .licenses import License
 
 
 _REGISTRY = {}
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+# (registry size, sorted registry) - rebuilt only when new datasets get registered
+_GATHERED = 0, OrderedDict()
 
 
 class Description(NamedTuple):
@@ -29,27 +32,56 @@ def register(**kwargs):
         return cls
 
     # path = kwargs.pop('path')
-    description = Description(**kwargs)
+    # the same short values (modality, body region, etc.) repeat across all the datasets
+    description = Description(**{k: sys.intern(v) if isinstance(v, str) else v for k, v in kwargs.items()})
     return decorator
 
 
 def _register(cls, name, description, level):
-    module = inspect.getmodule(inspect.stack()[level][0]).__name__
-    assert name not in _REGISTRY, name
+    if name in _REGISTRY:
+        raise ValueError(f'The dataset "{name}" is already registered')
+
+    module = sys._getframe(level).f_globals['__name__']
     _REGISTRY[name] = cls, module, description
 
 
 def gather_datasets():
-    for f in Path(__file__).resolve().parent.parent.iterdir():
+    global _GATHERED
+
+    for f in _PACKAGE_ROOT.iterdir():
+        if f.name.startswith('_'):
+            continue
+        if not (f.suffix == '.py' or (f / '__init__.py').exists()):
+            continue
+
         module_name = f'amid.{f.stem}'
-        importlib.import_module(module_name)
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            warnings.warn(f'Could not import {module_name}: {e}')
+
+    if _GATHERED[0] != len(_REGISTRY):
+        _GATHERED = len(_REGISTRY), OrderedDict(sorted(_REGISTRY.items()))
+    return _GATHERED[1]
+
+
+def _is_null(x):
+    return x is None or (isinstance(x, float) and x != x)
+
+
+@functools.lru_cache(maxsize=None)
+def _license_anchor(license_: License):
+    return f'<a href="{license_.url}">{license_.name}</a>'
+
 
-    return OrderedDict((k, _REGISTRY[k]) for k in sorted(_REGISTRY))
+@functools.lru_cache(maxsize=None)
+def _link_anchor(link: str):
+    return f'<a href="{link}">Source</a>'
 
 
 def prepare_for_table(name, count, module, description, version):
     def stringify(x):
-        if pd.isnull(x):
+        if _is_null(x):
             return ''
         if isinstance(x, str):
             return x
@@ -58,16 +90,16 @@ def prepare_for_table(name, count, module, description, version):
         return x
 
     entry = {'name': name, 'entries': count}
-    entry.update({k: v for k, v in description._asdict().items() if not pd.isnull(v)})
+    entry.update({k: v for k, v in description._asdict().items() if not _is_null(v)})
     license_ = entry.get('license', None)
     if license_:
         if isinstance(license_, License):
-            license_ = f'<a href="{license_.url}">{license_.name}</a>'
+            license_ = _license_anchor(license_)
         entry['license'] = license_
 
     link = entry.pop('link', None)
     if link is not None:
-        entry['link'] = f'<a href="{link}">Source</a>'
+        entry['link'] = _link_anchor(link)
 
     entry['name'] = f'<a href="https://neuro-ml.github.io/amid/{version}/datasets-api/#{module}.{name}">{name}</a>'
     return {k: stringify(v) for k, v in entry.items()}
@@ -1,8 +1,10 @@
+from functools import cached_property
+
 import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, field, register
-from .utils import PathOrStr
+from .utils import PathOrStr, nii_data
 
 
 @register(
@@ -37,28 +39,32 @@ class KiTS23(Dataset):
         if not (self.root / "dataset").exists():
             raise FileNotFoundError(f"Dataset not found in {self.root}")
 
-    @property
+    @cached_property
     def ids(self):
-        return tuple(sorted(sub.name for sub in (self.root / 'dataset').glob('*')))
+        return tuple(sorted(sub.name for sub in (self.root / 'dataset').iterdir() if sub.is_dir()))
+
+    def _nii_file(self, i, name):
+        # only the header and the array proxy are kept on the instance, the data is read on demand
+        files = self.__dict__.setdefault('_nii_files', {})
+        if (i, name) not in files:
+            files[i, name] = nb.load(self.root / 'dataset' / i / name)
+        return files[i, name]
 
     @field
     def image(self, i):
         # CT images are integer-valued, this will help us improve compression rates
-        image_file = nb.load(self.root / 'dataset' / i / 'imaging.nii.gz')
-        return np.int16(image_file.get_fdata()[...])
+        return nii_data(self._nii_file(i, 'imaging.nii.gz'), np.int16)
 
     # TODO add multiple segmentations
     @field
     def mask(self, i):
         """Combined annotation for kidneys, tumor and cyst (if present)."""
-        ct_scan_nifti = nb.load(self.root / 'dataset' / i / 'segmentation.nii.gz')
-        return np.int8(ct_scan_nifti.get_fdata())
+        return nii_data(self._nii_file(i, 'segmentation.nii.gz'), np.int8)
 
     @field
     def affine(self, i):
         """The 4x4 matrix that gives the image's spatial orientation."""
-        image_file = nb.load(self.root / 'dataset' / i / 'imaging.nii.gz')
-        return image_file.affine
+        return self._nii_file(i, 'imaging.nii.gz').affine
 
     @property
     def labels_names(self):
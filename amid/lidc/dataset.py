@@ -1,20 +1,22 @@
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
 from typing import List, Tuple, Union
 
 import numpy as np
+import pydicom
 import pylidc as pl
 from dicom_csv import (
     Series,
     expand_volumetric,
     get_common_tag,
     get_orientation_matrix,
-    get_tag,
     order_series,
     stack_images,
 )
 from pylidc.utils import consensus
-from scipy import stats
 
 from ..internals import Dataset, field, licenses, register
 from ..utils import PathOrStr, get_series_date
@@ -22,6 +24,9 @@ from .nodules import get_nodule
 from .typing import LIDCNodule
 
 
+_PYLIDCRC = os.path.expanduser('~/.pylidcrc')
+
+
 @register(
     body_region='Chest',
     license=licenses.CC_BY_30,
@@ -72,38 +77,65 @@ class LIDC(Dataset):
     https://www.ncbi.nlm.nih.gov/pmc/articles/PMC3041807/
     """
 
+    # the root last written to ~/.pylidcrc by this process
+    _configured_root = None
+
     def __init__(self, root: PathOrStr):
         super().__init__(root)
         self._check_config()
 
     def _check_config(self):
-        pylidc_config_start = '[dicom]\npath = '
-        if os.path.exists(os.path.expanduser('~/.pylidcrc')):
-            with open(os.path.expanduser('~/.pylidcrc'), 'r') as config_file:
-                content = config_file.read()
-            if content == f'{pylidc_config_start}{self.root}':
-                return
+        # pylidc reads the config on each access, so only the latest root matters
+        if LIDC._configured_root == self.root:
+            return
+
+        content = f'[dicom]\npath = {self.root}'
+        # the file is only read if its size matches the expected content, hence the fixed encoding and newlines
+        if os.path.exists(_PYLIDCRC) and os.stat(_PYLIDCRC).st_size == len(content.encode()):
+            with open(_PYLIDCRC, 'r', encoding='utf-8', newline='') as config_file:
+                if config_file.read() == content:
+                    LIDC._configured_root = self.root
+                    return
 
         # save _root path to ~/.pylidcrc file for pylidc
-        with open(os.path.expanduser('~/.pylidcrc'), 'w') as config_file:
-            config_file.write(f'{pylidc_config_start}{self.root}')
+        with open(_PYLIDCRC, 'w', encoding='utf-8', newline='') as config_file:
+            config_file.write(content)
+        LIDC._configured_root = self.root
 
     @property
     def ids(self):
-        result = [scan.series_instance_uid for scan in pl.query(pl.Scan).all()]
+        result = [uid for (uid,) in pl.query(pl.Scan.series_instance_uid).all()]
         return tuple(sorted(result))
 
+    @cached_property
+    def _scan_by_uid(self):
+        return {scan.series_instance_uid: scan for scan in pl.query(pl.Scan).all()}
+
     def _scan(self, i) -> pl.Scan:
-        _id = i.split('_')[-1]
-        return pl.query(pl.Scan).filter(pl.Scan.series_instance_uid == _id).first()
+        return self._scan_by_uid.get(i.split('_')[-1])
 
     def _series(self, i) -> Series:
-        series = expand_volumetric(self._scan(i).load_all_dicom_images(verbose=False))
-        series = order_series(series)
-        return series
+        # the series holds the pixel data of all the slices, so only the latest one is kept,
+        # and it is stored on the instance, so that it is released together with the dataset
+        cached = self.__dict__.get('_last_series')
+        if cached is None or cached[0] != i:
+            series = expand_volumetric(_load_dicom_images(self._scan(i)))
+            series = order_series(series)
+            cached = self.__dict__['_last_series'] = i, series
+        return cached[1]
+
+    def _clusters(self, i) -> List[List[pl.Annotation]]:
+        # the clustering is shared by `nodules`, `nodules_masks` and `cancer`
+        clusters = self.__dict__.setdefault('_clusters_cache', {})
+        if i not in clusters:
+            clusters[i] = self._scan(i).cluster_annotations()
+        return clusters[i]
 
     def _shape(self, i) -> Tuple[int, int, int]:
-        return stack_images(self._series(i), -1).shape
+        shapes = self.__dict__.setdefault('_shapes_cache', {})
+        if i not in shapes:
+            shapes[i] = stack_images(self._series(i), -1).shape
+        return shapes[i]
 
     @field
     def image(self, i) -> np.ndarray:
@@ -123,7 +155,7 @@ class LIDC(Dataset):
 
     @field
     def sop_uids(self, i) -> List[str]:
-        return [str(get_tag(i, 'SOPInstanceUID')) for i in self._series(i)]
+        return [str(image.SOPInstanceUID) for image in self._series(i)]
 
     @field
     def pixel_spacing(self, i) -> List[float]:
@@ -153,7 +185,9 @@ class LIDC(Dataset):
         And these differences appear in the maximum of 3 slices.
         Therefore, we consider their impact negligible.
         """
-        return (*self.pixel_spacing(i), stats.mode(np.diff(self.slice_locations(i)))[0].item())
+        steps, counts = np.unique(np.diff(self.slice_locations(i)), return_counts=True)
+        # the most frequent step, ties are resolved in favor of the smallest one
+        return (*self.pixel_spacing(i), steps[counts.argmax()].item())
 
     @field
     def contrast_used(self, i) -> bool:
@@ -203,7 +237,7 @@ class LIDC(Dataset):
     @field
     def nodules(self, i) -> List[List[LIDCNodule]]:
         nodules = []
-        for anns in self._scan(i).cluster_annotations():
+        for anns in self._clusters(i):
             nodule_annotations = []
             for ann in anns:
                 nodule_annotations.append(get_nodule(ann))
@@ -213,7 +247,7 @@ class LIDC(Dataset):
     @field
     def nodules_masks(self, i) -> List[List[np.ndarray]]:
         nodules = []
-        for anns in self._scan(i).cluster_annotations():
+        for anns in self._clusters(i):
             nodule_annotations = []
             for ann in anns:
                 nodule_annotations.append(ann.boolean_mask())
@@ -223,7 +257,28 @@ class LIDC(Dataset):
     @field
     def cancer(self, i) -> np.ndarray:
         cancer = np.zeros(self._shape(i), dtype=bool)
-        for anns in self._scan(i).cluster_annotations():
-            cancer |= consensus(anns, pad=np.inf)[0]
+        for anns in self._clusters(i):
+            # without padding the consensus is computed only inside the nodule's bounding box
+            mask, bbox = consensus(anns, ret_masks=False)
+            cancer[bbox] |= mask
 
         return cancer
+
+
+def _load_dicom_images(scan: pl.Scan) -> List[pydicom.Dataset]:
+    """A drop-in replacement for `scan.load_all_dicom_images` that reads the files in parallel."""
+    files = [file for file in Path(scan.get_path_to_dicom_files()).glob('*.dcm') if not file.name.startswith('.')]
+    # the threads only overlap the file reads: parsing is pure python and holds the GIL
+    with ThreadPoolExecutor(min(32, len(files) or 1)) as executor:
+        images = [
+            image
+            for image in executor.map(pydicom.dcmread, files)
+            if str(image.SeriesInstanceUID).strip() == scan.series_instance_uid
+            and str(image.StudyInstanceUID).strip() == scan.study_instance_uid
+        ]
+
+    # as in pylidc, among the slices with the same z coordinate the one with the lesser InstanceNumber is kept
+    unique = {}
+    for image in sorted(images, key=lambda x: float(x.InstanceNumber), reverse=True):
+        unique[float(image.ImagePositionPatient[-1])] = image
+    return [unique[z] for z in sorted(unique)]
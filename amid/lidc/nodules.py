@@ -14,13 +14,23 @@ from .typing import (
 )
 
 
-def get_nodule(ann: Annotation) -> LIDCNodule:
-    def init_enum(enum_class, value):
-        try:
-            return enum_class(value)
-        except ValueError:
-            pass
+# unknown values are mapped to None
+_LOOKUP = {
+    enum_class: {member.value: member for member in enum_class}
+    for enum_class in (
+        Calcification,
+        InternalStructure,
+        Lobulation,
+        Malignancy,
+        Sphericity,
+        Spiculation,
+        Subtlety,
+        Texture,
+    )
+}
 
+
+def get_nodule(ann: Annotation) -> LIDCNodule:
     bbox = ann.bbox_matrix().T
     bbox[1] = bbox[1] + 1
 
@@ -30,23 +40,24 @@ def get_nodule(ann: Annotation) -> LIDCNodule:
         diameter_mm=ann.diameter,
         surface_area_mm2=ann.surface_area,
         volume_mm3=ann.volume,
-        calcification=init_enum(Calcification, ann.calcification),
-        internal_structure=init_enum(InternalStructure, ann.internalStructure),
-        lobulation=init_enum(Lobulation, ann.lobulation),
-        malignancy=init_enum(Malignancy, ann.malignancy),
-        sphericity=init_enum(Sphericity, ann.sphericity),
-        spiculation=init_enum(Spiculation, ann.spiculation),
-        subtlety=init_enum(Subtlety, ann.subtlety),
-        texture=init_enum(Texture, ann.texture),
+        calcification=_LOOKUP[Calcification].get(ann.calcification),
+        internal_structure=_LOOKUP[InternalStructure].get(ann.internalStructure),
+        lobulation=_LOOKUP[Lobulation].get(ann.lobulation),
+        malignancy=_LOOKUP[Malignancy].get(ann.malignancy),
+        sphericity=_LOOKUP[Sphericity].get(ann.sphericity),
+        spiculation=_LOOKUP[Spiculation].get(ann.spiculation),
+        subtlety=_LOOKUP[Subtlety].get(ann.subtlety),
+        texture=_LOOKUP[Texture].get(ann.texture),
     )
 
 
 def flip_nodule(nodule: LIDCNodule, n_slices: int) -> LIDCNodule:
     bbox = nodule.bbox.copy()
-    start_slice, stop_slice = bbox[:, -1]
-    bbox[:, -1] = np.array([n_slices - stop_slice, n_slices - start_slice])
+    # [start, stop) -> [n - stop, n - start)
+    bbox[:, -1] = n_slices - bbox[::-1, -1]
 
-    center_voxel = nodule.center_voxel
+    # copy, so that the original nodule stays intact
+    center_voxel = np.array(nodule.center_voxel)
     center_voxel[-1] = n_slices - center_voxel[-1]
 
     return nodule._replace(
@@ -24,9 +24,8 @@ class Rescale(Transform):
     _order: int = 1
 
     def _spacing(spacing, _new_spacing):
-        _new_spacing = np.broadcast_to(_new_spacing, len(spacing)).copy()
-        _new_spacing[np.isnan(_new_spacing)] = np.array(spacing)[np.isnan(_new_spacing)]
-        return tuple(_new_spacing.tolist())
+        _new_spacing = np.broadcast_to(_new_spacing, len(spacing))
+        return tuple(np.where(np.isnan(_new_spacing), spacing, _new_spacing).tolist())
 
     def _scale_factor(spacing, _spacing):
         return np.float32(spacing) / np.float32(_spacing)
@@ -35,7 +34,8 @@ class Rescale(Transform):
         return _spacing
 
     def image(image, _scale_factor, _order):
-        return zoom(image.astype(np.float32), _scale_factor, order=_order)
+        return zoom(image.astype(np.float32, copy=False), _scale_factor, order=_order)
 
-    def cancer(cancer, _scale_factor, _order):
-        return zoom(cancer.astype(np.float32), _scale_factor, order=_order) > 0.5
+    def cancer(cancer, _scale_factor):
+        # nearest neighbour interpolation works on the boolean mask directly
+        return zoom(cancer, _scale_factor, order=0)
@@ -1,4 +1,5 @@
 import zipfile
+from functools import cached_property
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -6,6 +7,7 @@ import nibabel as nb
 import numpy as np
 
 from ..internals import Dataset, licenses, register
+from ..utils import nii_data
 
 
 @register(
@@ -67,9 +69,21 @@ class LiTS(Dataset):
 
     @property
     def ids(self):
-        result = set()
-        # zip archives for train images:
+        result = {f'lits-train-{num_id}' for num_id in self._train}
+
+        # folder for test images:
+        for file in (self.root / 'LITS-Challenge-Test-Data').glob('*'):
+            result.add('lits-test-' + file.stem.split('-')[-1])
+
+        return tuple(sorted(result))
+
+    @cached_property
+    def _train(self):
+        # zip archives for train images: num_id -> (archive, volume file, batch)
+        result = {}
         for archive in self.root.glob('*.zip'):
+            batch = '1' if ('1' in archive.stem) else '2'
+
             with ZipFile(archive) as zf:
                 for zipinfo in zf.infolist():
                     if zipinfo.is_dir():
@@ -77,28 +91,16 @@ class LiTS(Dataset):
 
                     file_stem = Path(zipinfo.filename).stem
                     if 'volume' in file_stem:
-                        result.add('lits-train-' + file_stem.split('-')[-1])
-
-        # folder for test images:
-        for file in (self.root / 'LITS-Challenge-Test-Data').glob('*'):
-            result.add('lits-test-' + file.stem.split('-')[-1])
+                        result.setdefault(file_stem.split('-')[-1], (archive, zipinfo.filename, batch))
 
-        return tuple(sorted(result))
+        return result
 
     def fold(self, i):
         num_id = i.split('-')[-1]
 
         if 'train' in i:
-            for archive in self.root.glob('*.zip'):
-                batch = '1' if ('1' in archive.stem) else '2'
-
-                with ZipFile(archive) as zf:
-                    for zipinfo in zf.infolist():
-                        if zipinfo.is_dir():
-                            continue
-
-                        if num_id == Path(zipinfo.filename).stem.split('-')[-1]:
-                            return f'train_batch_{batch}'
+            if num_id in self._train:
+                return f'train_batch_{self._train[num_id][2]}'
 
         else:  # if 'test' in i:
             return 'test'
@@ -107,46 +109,40 @@ class LiTS(Dataset):
         num_id = i.split('-')[-1]
 
         if 'train' in i:
-            for archive in self.root.glob('*.zip'):
-                with ZipFile(archive) as zf:
-                    for zipinfo in zf.infolist():
-                        if zipinfo.is_dir():
-                            continue
-
-                        file = Path(zipinfo.filename)
-                        if ('volume' in file.stem) and (num_id == file.stem.split('-')[-1]):
-                            return zipfile.Path(str(archive), str(file))
+            if num_id in self._train:
+                archive, file, _ = self._train[num_id]
+                return zipfile.Path(str(archive), file)
 
         else:  # if 'test' in i:
             return self.root / 'LITS-Challenge-Test-Data' / f'test-volume-{num_id}.nii'
 
         raise KeyError(f'Id "{i}" not found')
 
-    def image(self, i):
+    def _header(self, i) -> nb.Nifti1Header:
+        # only the header is read here, the voxel data stays in the archive
         with self._file(i).open('rb') as nii:
-            nii = nb.FileHolder(fileobj=nii)
-            image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-            # most ct scans are integer-valued, this will help us improve compression rates
-            return np.int16(image.get_fdata())
+            return nb.Nifti1Header.from_fileobj(nii)
+
+    def image(self, i):
+        file = self._file(i)
+        if isinstance(file, Path):
+            # test volumes are stored unpacked, so they can be memory-mapped
+            image = nb.load(file)
+        else:
+            image = nb.Nifti1Image.from_bytes(file.read_bytes())
+        # most ct scans are integer-valued, this will help us improve compression rates
+        return nii_data(image, np.int16)
 
     def affine(self, i):
         """The 4x4 matrix that gives the image's spatial orientation."""
-        with self._file(i).open('rb') as nii:
-            nii = nb.FileHolder(fileobj=nii)
-            image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-            return image.affine
+        return self._header(i).get_best_affine()
 
     def spacing(self, i):
         """Returns voxel spacing along axes (x, y, z)."""
-        with self._file(i).open('rb') as nii:
-            nii = nb.FileHolder(fileobj=nii)
-            image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-            return tuple(image.header['pixdim'][1:4])
+        return tuple(self._header(i)['pixdim'][1:4])
 
     def mask(self, i):
         file = self._file(i)
         if 'test' not in file.name:
-            with (file.parent / file.name.replace('volume', 'segmentation')).open('rb') as nii:
-                nii = nb.FileHolder(fileobj=nii)
-                image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return np.uint8(image.get_fdata())
+            segmentation = file.parent / file.name.replace('volume', 'segmentation')
+            return nii_data(nb.Nifti1Image.from_bytes(segmentation.read_bytes()), np.uint8)
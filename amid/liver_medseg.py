@@ -1,7 +1,6 @@
-import contextlib
-import gzip
 import re
 import zipfile
+from functools import cached_property
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -9,6 +8,7 @@ import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, field, licenses, register
+from .utils import nii_data, nii_gz_from_bytes, open_nii_gz_file
 
 
 @register(
@@ -50,7 +50,7 @@ class LiverMedseg(Dataset):
     ----------
     """
 
-    @property
+    @cached_property
     def ids(self):
         result = set()
         with ZipFile(self.root / 'img.zip') as zf:
@@ -66,34 +66,26 @@ class LiverMedseg(Dataset):
         num_id = i.split('_')[-1]
         return zipfile.Path(self.root / 'img.zip', f'img{num_id}.nii.gz')
 
+    def _header(self, i) -> nb.Nifti1Header:
+        # only the header is decompressed, the voxel data stays in the archive
+        with self._file(i).open('rb') as opened, open_nii_gz_file(opened) as image:
+            return image.header
+
     @field
     def image(self, i) -> np.ndarray:
-        with open_nii_gz_file(self._file(i)) as nii_file:
-            return np.asarray(nii_file.dataobj)
+        return np.asarray(nii_gz_from_bytes(self._file(i).read_bytes()).dataobj)
 
     @field
     def affine(self, i) -> np.ndarray:
         """The 4x4 matrix that gives the image's spatial orientation."""
-        with open_nii_gz_file(self._file(i)) as nii_file:
-            return nii_file.affine
+        return self._header(i).get_best_affine()
 
     def spacing(self, i) -> tuple:
-        with open_nii_gz_file(self._file(i)) as nii_file:
-            return tuple(nii_file.header['pixdim'][1:4])
+        return tuple(self._header(i)['pixdim'][1:4])
 
     @field
     def mask(self, i) -> np.ndarray:
         path = Path(str(self._file(i)).replace('img', 'mask'))
         folder, image = path.parent, path.name
         _file = zipfile.Path(folder, image)
-        with open_nii_gz_file(_file) as nii_file:
-            return np.asarray(nii_file.dataobj).astype(np.uint8)
-
-
-# TODO: sync with amid.utils
-@contextlib.contextmanager
-def open_nii_gz_file(file):
-    with file.open('rb') as opened:
-        with gzip.GzipFile(fileobj=opened) as nii:
-            nii = nb.FileHolder(fileobj=nii)
-            yield nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
+        return nii_data(nii_gz_from_bytes(_file.read_bytes()), np.uint8)
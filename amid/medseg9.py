@@ -1,6 +1,5 @@
-import contextlib
-import gzip
 import zipfile
+from functools import cached_property
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -8,6 +7,7 @@ import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, field, licenses, register
+from .utils import nii_data, nii_gz_from_bytes, open_nii_gz_file
 
 
 @register(
@@ -50,7 +50,7 @@ class Medseg9(Dataset):
 
     """
 
-    @property
+    @cached_property
     def ids(self):
         result = set()
 
@@ -71,23 +71,25 @@ class Medseg9(Dataset):
     def _file(self, i):
         return zipfile.Path(self.root / 'rp_im.zip', f'rp_im/{self._filename(i)}')
 
+    def _header(self, i) -> nb.Nifti1Header:
+        # only the header is decompressed, the voxel data stays in the archive
+        with self._file(i).open('rb') as opened, open_nii_gz_file(opened) as image:
+            return image.header
+
     @field
     def image(self, i):
-        with open_nii_gz_file(self._file(i)) as nii_image:
-            # most CT/MRI scans are integer-valued, this will help us improve compression rates
-            return np.int16(nii_image.get_fdata())
+        # most CT/MRI scans are integer-valued, this will help us improve compression rates
+        return nii_data(nii_gz_from_bytes(self._file(i).read_bytes()), np.int16)
 
     @field
     def affine(self, i):
         """The 4x4 matrix that gives the image's spatial orientation."""
-        with open_nii_gz_file(self._file(i)) as nii_image:
-            return nii_image.affine
+        return self._header(i).get_best_affine()
 
     @field
     def lungs(self, i):
         mask_file = zipfile.Path(self.root / 'rp_lung_msk.zip', f'rp_lung_msk/{self._filename(i)}')
-        with open_nii_gz_file(mask_file) as nii_image:
-            return np.bool_(nii_image.get_fdata())
+        return nii_data(nii_gz_from_bytes(mask_file.read_bytes()), bool)
 
     @field
     def covid(self, i):
@@ -96,15 +98,5 @@ class Medseg9(Dataset):
         0 - normal, 1 - ground-glass opacities (матовое стекло), 2 - consolidation (консолидация).
         """
         mask_file = zipfile.Path(self.root / 'rp_msk.zip', f'rp_msk/{self._filename(i)}')
-        with open_nii_gz_file(mask_file) as nii_image:
-            # most CT/MRI scans are integer-valued, this will help us improve compression rates
-            return np.uint8(nii_image.get_fdata())
-
-
-# TODO: sync with amid.utils
-@contextlib.contextmanager
-def open_nii_gz_file(file):
-    with file.open('rb') as opened:
-        with gzip.GzipFile(fileobj=opened) as nii:
-            nii = nb.FileHolder(fileobj=nii)
-            yield nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
+        # most CT/MRI scans are integer-valued, this will help us improve compression rates
+        return nii_data(nii_gz_from_bytes(mask_file.read_bytes()), np.uint8)
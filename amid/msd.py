@@ -8,6 +8,7 @@ import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, register
+from .utils import nii_data
 
 
 @register(
@@ -60,11 +61,11 @@ class MSD(Dataset):
     def image(self, i):
         with open_nii_gz(self.root, self._relative(i)) as (file, unpacked):
             if unpacked:
-                return np.int16(nb.load(file).get_fdata())
+                return nii_data(nb.load(file), np.int16)
             else:
                 with gzip.GzipFile(fileobj=file) as nii_gz:
                     nii = nb.FileHolder(fileobj=nii_gz)
-                    return np.int16(nb.Nifti1Image.from_file_map({'header': nii, 'image': nii}).get_fdata())
+                    return nii_data(nb.Nifti1Image.from_file_map({'header': nii, 'image': nii}), np.int16)
 
     def affine(self, i):
         """The 4x4 matrix that gives the image's spatial orientation."""
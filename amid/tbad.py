@@ -5,6 +5,7 @@ import nibabel as nb
 import numpy as np
 
 from .internals import Dataset, field, licenses, register
+from .utils import nii_data
 
 
 @register(
@@ -65,7 +66,7 @@ class TBAD(Dataset):
             with gzip.GzipFile(fileobj=opened) as nii:
                 nii = nb.FileHolder(fileobj=nii)
                 image = nb.Nifti1Image.from_file_map({'header': nii, 'image': nii})
-                return np.int16(image.get_fdata())
+                return nii_data(image, np.int16)
 
     def affine(self, i) -> np.ndarray:
         """The 4x4 matrix that gives the image's spatial orientation."""
@@ -3,6 +3,7 @@ import datetime
 import functools
 import itertools
 import zipfile
+import zlib
 from gzip import GzipFile
 from os import PathLike
 from pathlib import Path
@@ -68,6 +69,35 @@ def open_nii_gz_file(unpacked):
         yield nibabel.Nifti1Image.from_file_map({'header': nii, 'image': nii})
 
 
+def nii_gz_from_bytes(data: bytes) -> nibabel.Nifti1Image:
+    """Decompresses a whole ``.nii.gz`` payload in one shot and parses it.
+
+    Use it only when the voxel data is needed, the header alone is cheaper to read with `open_nii_gz_file`.
+    """
+    # gzip files may consist of several members, e.g. the ones produced by pigz or bgzip
+    chunks = []
+    while data:
+        decompressor = zlib.decompressobj(31)
+        chunks.append(decompressor.decompress(data))
+        if not decompressor.eof:
+            raise EOFError('Compressed file ended before the end-of-stream marker was reached')
+        # the members can be followed by zero padding
+        data = decompressor.unused_data.lstrip(b'\0')
+
+    return nibabel.Nifti1Image.from_bytes(b''.join(chunks))
+
+
+def nii_data(image: nibabel.Nifti1Image, dtype) -> np.ndarray:
+    """Reads the image data straight into ``dtype``.
+
+    Unlike ``get_fdata`` this doesn't materialize a float64 copy of the volume, unless the header requires scaling.
+    """
+    proxy = image.dataobj
+    if getattr(proxy, 'slope', 1) == 1 and getattr(proxy, 'inter', 0) == 0:
+        return np.asarray(proxy).astype(dtype, copy=False)
+    return image.get_fdata(caching='unchanged').astype(dtype)
+
+
 def get_series_date(series):
     try:
         study_date = get_common_tag(series, 'StudyDate')
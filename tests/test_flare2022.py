@@ -0,0 +1,47 @@
+import gzip
+import zipfile
+
+import nibabel
+import numpy as np
+import pytest
+
+from amid.flare2022 import FLARE2022
+
+
+def _nii_gz(value):
+    return gzip.compress(nibabel.Nifti1Image(np.full((2, 3, 4), value, dtype=np.int16), np.eye(4)).to_bytes())
+
+
+@pytest.fixture
+def root(tmp_path):
+    labeled = tmp_path / 'Training' / 'FLARE22_LabeledCase50'
+    labeled.mkdir(parents=True)
+    with zipfile.ZipFile(labeled / 'images.zip', 'w') as zf:
+        zf.writestr('images/', b'')
+        for case in ['0001', '0002']:
+            zf.writestr(f'images/FLARE22_Tr_{case}_0000.nii.gz', _nii_gz(int(case)))
+    with zipfile.ZipFile(labeled / 'labels.zip', 'w') as zf:
+        zf.writestr('labels/FLARE22_Tr_0001.nii.gz', _nii_gz(11))
+        zf.writestr('labels/README.txt', b'')
+
+    with zipfile.ZipFile(tmp_path / 'Training' / 'Part1.zip', 'w') as zf:
+        # the digits of VU0001 also appear in this name
+        zf.writestr('Part1/Case_00001_0000.nii.gz', _nii_gz(101))
+
+    (tmp_path / 'Validation').mkdir()
+    (tmp_path / 'Validation' / 'FLARETs_0001_0000.nii.gz').write_bytes(_nii_gz(201))
+    return tmp_path
+
+
+def test_flare2022_ids(root):
+    dataset = FLARE2022(root)
+    assert dataset.ids == ['TL0001', 'TL0002', 'TU00001', 'VU0001']
+    assert dataset._labels == {'TL0001': 'labels/FLARE22_Tr_0001.nii.gz'}
+
+    for i, value in [('TL0001', 1), ('TL0002', 2), ('TU00001', 101), ('VU0001', 201)]:
+        np.testing.assert_array_equal(dataset.image(i), value)
+        np.testing.assert_array_equal(dataset.affine(i), np.eye(4))
+
+    np.testing.assert_array_equal(dataset.mask('TL0001'), 11)
+    for i in ['TL0002', 'TU00001', 'VU0001']:
+        assert dataset.mask(i) is None
@@ -0,0 +1,54 @@
+import pylidc as pl
+import pytest
+from pydicom.dataset import FileDataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian
+
+from amid.lidc.dataset import _load_dicom_images
+
+
+def _save_slice(path, study_uid, series_uid, z, instance_number):
+    meta = FileMetaDataset()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+    meta.MediaStorageSOPInstanceUID = f'1.2.3.{instance_number}'
+
+    image = FileDataset(None, {}, file_meta=meta, preamble=b'\0' * 128)
+    image.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    image.StudyInstanceUID = study_uid
+    image.SeriesInstanceUID = series_uid
+    image.InstanceNumber = instance_number
+    image.ImagePositionPatient = [0, 0, z]
+    image.save_as(path)
+
+
+@pytest.fixture
+def scan(tmp_path, monkeypatch):
+    # the annotations database is shipped with pylidc, only the DICOM files are synthetic
+    monkeypatch.setattr(pl.Scan, 'get_path_to_dicom_files', lambda self: str(tmp_path))
+    return pl.query(pl.Scan).first()
+
+
+def test_load_dicom_images(tmp_path, scan):
+    uids = scan.study_instance_uid, scan.series_instance_uid
+    # (z, InstanceNumber): two slices share z=-1, one of them must be dropped
+    slices = [(3.5, 1), (-1, 5), (0, 3), (-1, 2), (10, 4), (2, 6)]
+    for idx, (z, instance_number) in enumerate(slices):
+        _save_slice(tmp_path / f'{idx}.dcm', *uids, z, instance_number)
+    # slices from another series and hidden files are ignored
+    _save_slice(tmp_path / 'other.dcm', uids[0], '1.2.3', 1, 7)
+    _save_slice(tmp_path / '.hidden.dcm', *uids, 1, 8)
+
+    def key(images):
+        return [(float(image.ImagePositionPatient[-1]), int(image.InstanceNumber)) for image in images]
+
+    expected = key(scan.load_all_dicom_images(verbose=False))
+    assert expected == [(-1, 2), (0, 3), (2, 6), (3.5, 1), (10, 4)]
+    assert key(_load_dicom_images(scan)) == expected
+
+
+@pytest.mark.parametrize('n_files', [0, 1])
+def test_load_dicom_images_small(tmp_path, scan, n_files):
+    for idx in range(n_files):
+        _save_slice(tmp_path / f'{idx}.dcm', scan.study_instance_uid, scan.series_instance_uid, idx, idx + 1)
+
+    assert len(_load_dicom_images(scan)) == n_files
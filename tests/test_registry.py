@@ -0,0 +1,49 @@
+import pytest
+
+from amid.internals import gather_datasets, licenses, register
+from amid.internals.registry import _REGISTRY, Description, prepare_for_table
+
+
+def test_register_module():
+    @register(modality='CT')
+    class RegistryDummy:
+        pass
+
+    try:
+        cls, module, description = _REGISTRY['RegistryDummy']
+        assert cls is RegistryDummy
+        assert module == __name__
+        assert description.modality == 'CT'
+
+        with pytest.raises(ValueError, match='already registered'):
+            register()(RegistryDummy)
+    finally:
+        _REGISTRY.pop('RegistryDummy', None)
+
+
+def test_gather_datasets_cached():
+    datasets = gather_datasets()
+    assert list(datasets) == sorted(datasets)
+    assert gather_datasets() is datasets
+
+    @register()
+    class RegistryDummy:
+        pass
+
+    try:
+        assert 'RegistryDummy' in gather_datasets()
+    finally:
+        _REGISTRY.pop('RegistryDummy', None)
+    assert 'RegistryDummy' not in gather_datasets()
+
+
+def test_prepare_for_table():
+    description = Description(body_region='Head', license=licenses.CC0_10, modality=('CT', 'MRI'), task=float('nan'))
+    entry = prepare_for_table('Dummy', 10, 'amid.dummy', description, 'latest')
+    assert entry == {
+        'name': '<a href="https://neuro-ml.github.io/amid/latest/datasets-api/#amid.dummy.Dummy">Dummy</a>',
+        'entries': 10,
+        'body_region': 'Head',
+        'license': '<a href="https://creativecommons.org/publicdomain/zero/1.0/">CC0 1.0</a>',
+        'modality': 'CT, MRI',
+    }
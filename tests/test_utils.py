@@ -0,0 +1,41 @@
+import gzip
+
+import nibabel
+import numpy as np
+
+from amid.utils import nii_data, nii_gz_from_bytes
+
+
+def test_nii_gz_from_bytes(tmp_path):
+    array = np.arange(60, dtype=np.int16).reshape(3, 4, 5)
+    affine = np.diag([2.0, 3.0, 4.0, 1.0])
+    nibabel.save(nibabel.Nifti1Image(array, affine), tmp_path / 'image.nii.gz')
+
+    data = (tmp_path / 'image.nii.gz').read_bytes()
+    image = nii_gz_from_bytes(data)
+    np.testing.assert_array_equal(np.asarray(image.dataobj), array)
+    np.testing.assert_array_equal(image.affine, affine)
+
+    # the result must not depend on the compression level
+    image = nii_gz_from_bytes(gzip.compress(gzip.decompress(data), compresslevel=1))
+    np.testing.assert_array_equal(np.asarray(image.dataobj), array)
+
+    # concatenated gzip members are valid gzip as well
+    raw = gzip.decompress(data)
+    image = nii_gz_from_bytes(gzip.compress(raw[:400]) + gzip.compress(raw[400:]))
+    np.testing.assert_array_equal(np.asarray(image.dataobj), array)
+    np.testing.assert_array_equal(image.affine, affine)
+
+
+def test_nii_data():
+    array = np.arange(-30, 30, dtype=np.int16).reshape(3, 4, 5)
+    image = nibabel.Nifti1Image(array, np.eye(4))
+    data = nii_data(image, np.int16)
+    assert data.dtype == np.int16
+    np.testing.assert_array_equal(data, array)
+
+    image.header.set_slope_inter(0.5, -1)
+    image = nibabel.Nifti1Image.from_bytes(image.to_bytes())
+    assert (image.dataobj.slope, image.dataobj.inter) == (0.5, -1)
+    np.testing.assert_array_equal(nii_data(image, np.int16), np.int16(image.get_fdata()))
+    np.testing.assert_array_equal(nii_data(image, bool), np.bool_(image.get_fdata()))